@@ -9,7 +9,7 @@
  * KEY RESPONSIBILITIES:
  * - generate(): return THREE.Group with hull, exhausts, materials
  * - createRNG(seed), random(), uniform(), randInt() for procedural build
- * - buildHullSegments(), segmentsToGeometry(), addExhausts()
+ * - buildHullSegments(), segmentsToGeometry() (single-pass box writer), addExhausts()
  *
  * RELATED: Enemy.js (ship models), SceneManager (if used for dynamic ships).
  *
@@ -20,6 +20,66 @@ import * as THREE from 'three';
 
 const _v = new THREE.Vector3();
 const _m = new THREE.Matrix4();
+const _box = new THREE.Box3();
+const _size = new THREE.Vector3();
+
+// Unit box template; hull boxes are written straight from it into one buffer,
+// and wings reference it directly with a per-mesh scale
+const UNIT_BOX = new THREE.BoxGeometry(1, 1, 1);
+const UNIT_BOX_POSITIONS = UNIT_BOX.attributes.position.array;
+const UNIT_BOX_NORMALS = UNIT_BOX.attributes.normal.array;
+const UNIT_BOX_INDICES = UNIT_BOX.index.array;
+const UNIT_BOX_VERTS = UNIT_BOX.attributes.position.count;
+
+// Unit exhaust cone pointing down +X (height on X, radius on Y/Z); each
+// exhaust reuses it and sizes itself via mesh.scale
+const EXHAUST_CONE_ROTATION = new THREE.Matrix4().makeRotationZ(-Math.PI / 2);
+const EXHAUST_CONE = new THREE.ConeGeometry(1, 1, 8).applyMatrix4(EXHAUST_CONE_ROTATION);
+
+// Unit glow sphere; each exhaust glow scales it to its radius
+const EXHAUST_GLOW = new THREE.SphereGeometry(1, 8, 6);
+
+// Nozzle material has no per-ship inputs, so every generated ship shares it
+const EXHAUST_CONE_MATERIAL = new THREE.MeshStandardMaterial({
+  color: 0x222222,
+  metalness: 0.9,
+  roughness: 0.2,
+});
+
+/**
+ * Build one indexed geometry from axis-aligned boxes ({ x, y, z, sx, sy, sz })
+ * in a single pass, without a BoxGeometry + merge round trip per box.
+ */
+function boxesToGeometry(boxes) {
+  const positions = new Float32Array(boxes.length * UNIT_BOX_VERTS * 3);
+  const normals = new Float32Array(positions.length);
+  const indices = new Uint16Array(boxes.length * UNIT_BOX_INDICES.length);
+
+  for (let b = 0; b < boxes.length; b++) {
+    const { x, y, z, sx, sy, sz } = boxes[b];
+    const vertBase = b * UNIT_BOX_VERTS;
+
+    for (let i = 0; i < UNIT_BOX_VERTS; i++) {
+      const src = i * 3;
+      const dst = (vertBase + i) * 3;
+      positions[dst] = UNIT_BOX_POSITIONS[src] * sx + x;
+      positions[dst + 1] = UNIT_BOX_POSITIONS[src + 1] * sy + y;
+      positions[dst + 2] = UNIT_BOX_POSITIONS[src + 2] * sz + z;
+    }
+    normals.set(UNIT_BOX_NORMALS, vertBase * 3);
+
+    const indexBase = b * UNIT_BOX_INDICES.length;
+    for (let i = 0; i < UNIT_BOX_INDICES.length; i++) {
+      indices[indexBase + i] = UNIT_BOX_INDICES[i] + vertBase;
+    }
+  }
+
+  const geometry = new THREE.BufferGeometry();
+  geometry.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+  geometry.setAttribute('normal', new THREE.BufferAttribute(normals, 3));
+  geometry.setIndex(new THREE.BufferAttribute(indices, 1));
+  return geometry;
+}
 
 export class SpaceshipGenerator {
   constructor(seed = null) {
@@ -78,14 +138,14 @@ export class SpaceshipGenerator {
     }
 
     // Center the model
-    const box = new THREE.Box3().setFromObject(group);
-    const center = box.getCenter(new THREE.Vector3());
+    _box.setFromObject(group);
+    const center = _box.getCenter(_v);
     group.children.forEach(child => {
       child.position.sub(center);
     });
 
     // Normalize scale to roughly unit size
-    const size = box.getSize(new THREE.Vector3());
+    const size = _box.getSize(_size);
     const maxDim = Math.max(size.x, size.y, size.z);
     const scale = 1.5 / maxDim;
     group.scale.setScalar(scale);
@@ -176,59 +236,16 @@ export class SpaceshipGenerator {
   }
 
   segmentsToGeometry(segments) {
-    const geometries = [];
-
-    for (const seg of segments) {
-      const geo = new THREE.BoxGeometry(seg.length, seg.height, seg.width);
-      geo.translate(seg.x, seg.offsetY, seg.offsetZ);
-      geometries.push(geo);
-    }
-
-    return this.mergeGeometries(geometries);
-  }
-
-  mergeGeometries(geometries) {
-    let totalVerts = 0;
-    let totalIndices = 0;
-
-    for (const geo of geometries) {
-      totalVerts += geo.attributes.position.count;
-      totalIndices += geo.index.count;
-    }
-
-    const positions = new Float32Array(totalVerts * 3);
-    const normals = new Float32Array(totalVerts * 3);
-    const indices = new Uint16Array(totalIndices);
-
-    let vertOffset = 0;
-    let indexOffset = 0;
-    let vertCount = 0;
-
-    for (const geo of geometries) {
-      const pos = geo.attributes.position.array;
-      const norm = geo.attributes.normal.array;
-      const idx = geo.index.array;
-
-      positions.set(pos, vertOffset * 3);
-      normals.set(norm, vertOffset * 3);
-
-      for (let i = 0; i < idx.length; i++) {
-        indices[indexOffset + i] = idx[i] + vertCount;
-      }
-
-      vertOffset += geo.attributes.position.count;
-      indexOffset += idx.length;
-      vertCount += geo.attributes.position.count;
-
-      geo.dispose();
-    }
-
-    const merged = new THREE.BufferGeometry();
-    merged.setAttribute('position', new THREE.BufferAttribute(positions, 3));
-    merged.setAttribute('normal', new THREE.BufferAttribute(normals, 3));
-    merged.setIndex(new THREE.BufferAttribute(indices, 1));
-
-    return merged;
+    return boxesToGeometry(
+      segments.map(seg => ({
+        x: seg.x,
+        y: seg.offsetY,
+        z: seg.offsetZ,
+        sx: seg.length,
+        sy: seg.height,
+        sz: seg.width,
+      }))
+    );
   }
 
   addExhausts(group, segments, glowColor) {
@@ -238,35 +255,28 @@ export class SpaceshipGenerator {
     const numExhausts = this.randInt(1, 3);
     const spacing = rearSeg.width / (numExhausts + 1);
 
+    // All exhausts on a ship share the same glow material
+    const glowMat = new THREE.MeshBasicMaterial({
+      color: glowColor,
+      transparent: true,
+      opacity: 0.8,
+    });
+
     for (let i = 0; i < numExhausts; i++) {
       const z = -rearSeg.width / 2 + spacing * (i + 1);
       
       // Exhaust cone
-      const coneGeo = new THREE.ConeGeometry(
-        this.uniform(0.08, 0.15),
-        this.uniform(0.15, 0.3),
-        8
-      );
-      coneGeo.rotateZ(-Math.PI / 2);
+      const coneRadius = this.uniform(0.08, 0.15);
+      const coneHeight = this.uniform(0.15, 0.3);
       
-      const coneMat = new THREE.MeshStandardMaterial({
-        color: 0x222222,
-        metalness: 0.9,
-        roughness: 0.2,
-      });
-      
-      const cone = new THREE.Mesh(coneGeo, coneMat);
+      const cone = new THREE.Mesh(EXHAUST_CONE, EXHAUST_CONE_MATERIAL);
+      cone.scale.set(coneHeight, coneRadius, coneRadius);
       cone.position.set(exhaustX + 0.1, rearSeg.offsetY, z);
       group.add(cone);
 
       // Glow
-      const glowGeo = new THREE.SphereGeometry(this.uniform(0.06, 0.12), 8, 8);
-      const glowMat = new THREE.MeshBasicMaterial({
-        color: glowColor,
-        transparent: true,
-        opacity: 0.8,
-      });
-      const glow = new THREE.Mesh(glowGeo, glowMat);
+      const glow = new THREE.Mesh(EXHAUST_GLOW, glowMat);
+      glow.scale.setScalar(this.uniform(0.06, 0.12));
       glow.position.set(exhaustX + 0.15, rearSeg.offsetY, z);
       group.add(glow);
     }
@@ -274,7 +284,15 @@ export class SpaceshipGenerator {
 
   addProtrusions(group, segments, hullColor) {
     const numProtrusions = this.randInt(1, 3);
+    const mat = new THREE.MeshStandardMaterial({
+      color: hullColor.clone().multiplyScalar(0.8),
+      metalness: 0.7,
+      roughness: 0.3,
+    });
     
+    // Collected into one merged mesh rather than a Mesh per protrusion
+    const boxes = [];
+
     for (let i = 0; i < numProtrusions; i++) {
       const segIndex = this.randInt(1, Math.max(1, segments.length - 2));
       const seg = segments[segIndex];
@@ -286,31 +304,25 @@ export class SpaceshipGenerator {
       const width = this.uniform(0.1, 0.2);
       const height = this.uniform(0.1, 0.2);
       
-      const geo = new THREE.BoxGeometry(length, height, width);
-      const mat = new THREE.MeshStandardMaterial({
-        color: hullColor.clone().multiplyScalar(0.8),
-        metalness: 0.7,
-        roughness: 0.3,
-      });
-      
-      const mesh = new THREE.Mesh(geo, mat);
+      const box = {
+        x: seg.x,
+        y: seg.offsetY,
+        z: seg.offsetZ,
+        sx: length,
+        sy: height,
+        sz: width,
+      };
       
       if (vertical) {
-        mesh.position.set(
-          seg.x,
-          seg.offsetY + (seg.height / 2 + height / 2) * side,
-          seg.offsetZ
-        );
+        box.y += (seg.height / 2 + height / 2) * side;
       } else {
-        mesh.position.set(
-          seg.x,
-          seg.offsetY,
-          seg.offsetZ + (seg.width / 2 + width / 2) * side
-        );
+        box.z += (seg.width / 2 + width / 2) * side;
       }
       
-      group.add(mesh);
+      boxes.push(box);
     }
+
+    group.add(new THREE.Mesh(boxesToGeometry(boxes), mat));
   }
 
   addWings(group, segments, hullColor) {
@@ -321,7 +333,6 @@ export class SpaceshipGenerator {
     const wingWidth = this.uniform(0.4, 0.8);
     const wingThickness = this.uniform(0.04, 0.08);
     
-    const wingGeo = new THREE.BoxGeometry(wingWidth, wingThickness, wingLength);
     const wingMat = new THREE.MeshStandardMaterial({
       color: hullColor.clone().multiplyScalar(0.9),
       metalness: 0.7,
@@ -330,7 +341,8 @@ export class SpaceshipGenerator {
 
     // Add wings on both sides (symmetric)
     for (const side of [-1, 1]) {
-      const wing = new THREE.Mesh(wingGeo, wingMat);
+      const wing = new THREE.Mesh(UNIT_BOX, wingMat);
+      wing.scale.set(wingWidth, wingThickness, wingLength);
       wing.position.set(
         seg.x,
         seg.offsetY,
@@ -354,9 +366,11 @@ export function generateEnemyShip(seed = null) {
 }
 
 export function getOrCreateEnemyShip(seed) {
-  if (!shipCache.has(seed)) {
-    shipCache.set(seed, generateEnemyShip(seed));
+  let ship = shipCache.get(seed);
+  if (!ship) {
+    ship = generateEnemyShip(seed);
+    shipCache.set(seed, ship);
   }
-  return shipCache.get(seed);
+  return ship;
 }
 